@@ -42,7 +42,7 @@ def process_frame(
         if detection and isinstance(detection, BBox):
             bbox_tuple = (detection.x, detection.y, detection.width, detection.height)
 
-    frame_data = FrameData(timestamp=current_time, frame=frame.copy(), bbox=bbox_tuple)
+    frame_data = FrameData(timestamp=current_time, frame=frame, bbox=bbox_tuple)
     rolling_buffer.push(frame_data)
 
     return delay_confirm.update(is_fallen=is_fallen, current_time=current_time)
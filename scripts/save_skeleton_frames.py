@@ -119,8 +119,12 @@ def save_skeleton_frames(video_path: str, output_dir: str, every_n_frames: int =
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # 開啟影片
-    cap = cv2.VideoCapture(video_path)
+    # 開啟影片（FFmpeg 後端，可用時使用硬體解碼，否則自動退回軟體解碼）
+    cap = cv2.VideoCapture(
+        video_path,
+        cv2.CAP_FFMPEG,
+        [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+    )
     if not cap.isOpened():
         logger.error(f"無法開啟影片: {video_path}")
         return 1
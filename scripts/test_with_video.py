@@ -106,8 +106,12 @@ def test_video(
 ) -> int:
     """使用影片測試跌倒偵測"""
 
-    # 開啟影片
-    cap = cv2.VideoCapture(video_path)
+    # 開啟影片（FFmpeg 後端，可用時使用硬體解碼，否則自動退回軟體解碼）
+    cap = cv2.VideoCapture(
+        video_path,
+        cv2.CAP_FFMPEG,
+        [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+    )
     if not cap.isOpened():
         logger.error(f"無法開啟影片: {video_path}")
         return 1
@@ -176,7 +180,7 @@ def test_video(
             rolling_buffer.push(
                 FrameData(
                     timestamp=current_time,
-                    frame=frame.copy(),
+                    frame=frame,
                     bbox=bbox_tuple,
                 )
             )
@@ -1,11 +1,10 @@
 import threading
-from collections import deque
 from dataclasses import dataclass
 
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameData:
     timestamp: float
     frame: np.ndarray
@@ -13,29 +12,72 @@ class FrameData:
 
 
 class RollingBuffer:
+    # get_clip copies at most this many frames per lock acquisition (~15 MB at 640x480x3),
+    # so push() never waits on a whole clip copy
+    _COPY_CHUNK_FRAMES = 16
+
     def __init__(self, buffer_seconds: float = 10.0, fps: float = 15.0):
         """
         Initialize the rolling buffer with capacity determined by time window and frame rate.
         
+        Frame pixels are stored in a single preallocated pool of shape (max_frames, H, W, C) that is
+        recycled as the ring advances, so steady-state pushes do not allocate new image buffers.
+        The pool is allocated lazily on the first push, once the frame shape and dtype are known.
+        Timestamps and bboxes are kept column-wise in fixed-size arrays indexed by the same slot.
+        A running push counter lets get_clip detect slots overwritten while it copies without the lock.
+        
         Parameters:
         	buffer_seconds (float): Number of seconds of video to retain in the buffer.
         	fps (float): Expected frames per second used to compute the buffer capacity.
         """
         self.max_frames = int(buffer_seconds * fps)
-        self.buffer: deque[FrameData] = deque(maxlen=self.max_frames)
+        self._frames: np.ndarray | None = None
+        self._timestamps = np.zeros(self.max_frames, dtype=np.float64)
+        self._bboxes = np.zeros((self.max_frames, 4), dtype=np.int32)
+        self._has_bbox = np.zeros(self.max_frames, dtype=bool)
+        self._head = 0
+        self._count = 0
+        self._pushed = 0  # total pushes; push number n lives in its slot until push n + max_frames
+        self._valid_from = 0  # first push number still held by the pool (advanced by clear/realloc)
         self._lock = threading.Lock()
 
     def push(self, frame_data: FrameData) -> None:
         """
-        Append a FrameData item to the rolling buffer using the internal lock to ensure thread safety.
+        Copy a FrameData item into the next pool slot using the internal lock to ensure thread safety.
         
-        The buffer is bounded by its configured capacity; if full, appending will discard the oldest frame.
+        The buffer is bounded by its configured capacity; if full, the oldest frame's slot is overwritten.
+        The caller keeps ownership of `frame_data.frame` and may modify it after this call returns.
+        If the frame shape or dtype differs from the pool's, the pool is reallocated and older frames are dropped.
         
         Parameters:
             frame_data (FrameData): The frame to store (includes timestamp, image, and optional bbox).
         """
+        if self.max_frames <= 0:
+            return
+
+        frame = frame_data.frame
         with self._lock:
-            self.buffer.append(frame_data)
+            if (
+                self._frames is None
+                or self._frames.shape[1:] != frame.shape
+                or self._frames.dtype != frame.dtype
+            ):
+                self._frames = np.empty((self.max_frames, *frame.shape), dtype=frame.dtype)
+                self._head = 0
+                self._count = 0
+                self._valid_from = self._pushed
+
+            slot = self._head
+            np.copyto(self._frames[slot], frame)
+            self._timestamps[slot] = frame_data.timestamp
+            if frame_data.bbox is None:
+                self._has_bbox[slot] = False
+            else:
+                self._bboxes[slot] = frame_data.bbox
+                self._has_bbox[slot] = True
+            self._head = (self._head + 1) % self.max_frames
+            self._count = min(self._count + 1, self.max_frames)
+            self._pushed += 1
 
     def get_clip(
         self,
@@ -46,27 +88,64 @@ class RollingBuffer:
         """
         Retrieve frames whose timestamps fall within a time window centered on the given event time.
         
+        Returned frames are copies of the pool slots, so they stay valid after the ring overwrites them.
+        Pixels are copied in fancy-indexed gathers of at most `_COPY_CHUNK_FRAMES` slots, releasing
+        the lock between gathers so concurrent pushes are delayed by one chunk copy at most. A frame
+        that the ring overwrites before its chunk is copied is left out of the result.
+        
         Parameters:
             event_time (float): Reference timestamp in seconds for the clip.
             before_sec (float): Seconds before `event_time` to include.
             after_sec (float): Seconds after `event_time` to include.
         
         Returns:
-            list[FrameData]: Frames with timestamps between `event_time - before_sec` and `event_time + after_sec` (inclusive).
+            list[FrameData]: Frames with timestamps between `event_time - before_sec` and `event_time + after_sec` (inclusive), oldest first.
         """
         start_time = event_time - before_sec
         end_time = event_time + after_sec
         with self._lock:
-            return [f for f in self.buffer if start_time <= f.timestamp <= end_time]
+            if self._count == 0:
+                return []
+
+            # Slots in chronological order, oldest first
+            order = (self._head - self._count + np.arange(self._count)) % self.max_frames
+            timestamps = self._timestamps[order]
+            mask = (timestamps >= start_time) & (timestamps <= end_time)
+            slots = order[mask]
+            push_numbers = (self._pushed - self._count + np.arange(self._count))[mask]
+            timestamps = timestamps[mask]
+            bboxes = self._bboxes[slots]
+            has_bbox = self._has_bbox[slots]
+
+        clip = []
+        for start in range(0, len(slots), self._COPY_CHUNK_FRAMES):
+            chunk = slice(start, start + self._COPY_CHUNK_FRAMES)
+            with self._lock:
+                oldest_live = max(self._valid_from, self._pushed - self.max_frames)
+                live = start + np.flatnonzero(push_numbers[chunk] >= oldest_live)
+                frames = self._frames[slots[live]]
+
+            for frame, i in zip(frames, live):
+                clip.append(
+                    FrameData(
+                        timestamp=float(timestamps[i]),
+                        frame=frame,
+                        bbox=tuple(bboxes[i].tolist()) if has_bbox[i] else None,
+                    )
+                )
+        return clip
 
     def clear(self) -> None:
         """
         Clear all stored frames from the rolling buffer in a thread-safe manner.
         
         This removes every FrameData currently held so subsequent reads see an empty buffer.
+        The frame pool itself is kept for reuse.
         """
         with self._lock:
-            self.buffer.clear()
+            self._head = 0
+            self._count = 0
+            self._valid_from = self._pushed
 
     def __len__(self) -> int:
         """
@@ -78,4 +157,4 @@ class RollingBuffer:
             int: The number of FrameData objects in the buffer.
         """
         with self._lock:
-            return len(self.buffer)
\ No newline at end of file
+            return self._count
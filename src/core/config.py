@@ -8,6 +8,9 @@ from dotenv import load_dotenv
 # Load .env file before processing config
 load_dotenv()
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class CameraConfig:
@@ -91,7 +94,7 @@ def _process_config_values(data: dict) -> dict:
 
 def load_config(config_path: str = "config/settings.yaml") -> Config:
     with open(config_path, encoding="utf-8") as f:
-        raw_config = yaml.safe_load(f)
+        raw_config = yaml.load(f, Loader=_YAML_LOADER)
 
     config_data = _process_config_values(raw_config)
 
@@ -1,9 +1,19 @@
 import numpy as np
-from ultralytics import YOLO
 
 from src.detection.bbox import BBox
 from src.detection.skeleton import Skeleton
 
+YOLO = None  # bound to ultralytics.YOLO on first use (importing ultralytics pulls in torch)
+
+
+def _yolo_class():
+    global YOLO
+    if YOLO is None:
+        from ultralytics import YOLO as _YOLO
+
+        YOLO = _YOLO
+    return YOLO
+
 
 class Detector:
     def __init__(
@@ -12,7 +22,7 @@ class Detector:
         confidence: float = 0.5,
         classes: list[int] | None = None,
     ):
-        self.model = YOLO(model_path)
+        self.model = _yolo_class()(model_path)
         self.confidence = confidence
         self.classes = classes if classes is not None else [0]
 
@@ -50,7 +60,7 @@ class PoseDetector:
         model_path: str = "yolo11s-pose.pt",
         confidence: float = 0.5,
     ):
-        self.model = YOLO(model_path)
+        self.model = _yolo_class()(model_path)
         self.confidence = confidence
 
     def detect(self, frame: np.ndarray) -> list[Skeleton]:
@@ -28,7 +28,7 @@ class Keypoint(IntEnum):
     RIGHT_ANKLE = 16
 
 
-@dataclass
+@dataclass(slots=True)
 class Skeleton:
     """Skeleton with 17 keypoints from YOLOv8 Pose."""
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import threading
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -28,6 +29,7 @@ class ClipRecorder(FallEventObserver):
         event_logger: EventLogger | None = None,
         clip_before_sec: float = 5.0,
         clip_after_sec: float = 5.0,
+        timer_factory: Callable[..., threading.Timer] = threading.Timer,
     ):
         """
         Initialize the ClipRecorder and prepare storage, encoding, and timing configuration.
@@ -40,6 +42,10 @@ class ClipRecorder(FallEventObserver):
             event_logger (EventLogger | None): Optional logger that will be updated with saved clip paths.
             clip_before_sec (float): Number of seconds of footage to include before the event time.
             clip_after_sec (float): Number of seconds of footage to include after the event time.
+            timer_factory (Callable[..., threading.Timer]): Called as `timer_factory(clip_after_sec, callback, args=[event])`,
+                like `threading.Timer`, to schedule each delayed save. The returned object must expose a settable
+                `daemon` attribute, `start()`, `cancel()`, and an `ident` equal to the ident of the thread that runs
+                the callback; finished timers are removed from the pending list by matching that ident.
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -49,6 +55,7 @@ class ClipRecorder(FallEventObserver):
         self.event_logger = event_logger
         self.clip_before_sec = clip_before_sec
         self.clip_after_sec = clip_after_sec
+        self._timer_factory = timer_factory
         self._pending_recordings: list[threading.Timer] = []
         self._recordings_lock = threading.Lock()
 
@@ -116,7 +123,7 @@ class ClipRecorder(FallEventObserver):
             logger.warning("on_fall_confirmed called without rolling_buffer configured")
             return
 
-        timer = threading.Timer(
+        timer = self._timer_factory(
             self.clip_after_sec,
             self._save_clip_delayed,
             args=[event],
@@ -20,6 +20,9 @@ class EventLogger(FallEventObserver):
 
         # check_same_thread=False allows connection to be used from background threads
         self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        # WAL lets ClipCleanup read/update from its own connection without blocking writes here
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
         self._create_tables()
 
     def _create_tables(self) -> None:
@@ -33,8 +36,11 @@ class EventLogger(FallEventObserver):
         - `notification_count` (INTEGER, default 1)
         - `clip_path` (TEXT)
         - `created_at` (REAL NOT NULL)
+
+        Also creates an index on `created_at` so the retention query in ClipCleanup
+        scans only expired rows instead of the whole table.
         
-        Commits the transaction after executing the schema statement.
+        Commits the transaction after executing the schema statements.
         """
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS events (
@@ -46,6 +52,9 @@ class EventLogger(FallEventObserver):
                 created_at REAL NOT NULL
             )
         """)
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_events_created_at ON events(created_at)"
+        )
         self.conn.commit()
 
     def on_fall_confirmed(self, event: FallEvent) -> None:
@@ -6,6 +6,7 @@
 
 import sqlite3
 import time
+from contextlib import closing
 from pathlib import Path
 
 
@@ -78,39 +79,37 @@ class ClipCleanup:
         would_delete_count = 0
 
         expired_clips = self.get_expired_clips()
-
-        conn = sqlite3.connect(str(self.db_path))
-
-        for record in expired_clips:
-            clip_path = Path(record["clip_path"])
-
-            # 檢查檔案是否存在
-            if not clip_path.exists():
-                skipped_count += 1
-                continue
-
-            # 記錄檔案大小
-            file_size = clip_path.stat().st_size
-
-            if dry_run:
-                # 乾運行模式：不實際刪除
-                would_delete_count += 1
-            else:
-                # 刪除檔案
-                clip_path.unlink()
-                deleted_count += 1
-                freed_bytes += file_size
-
-                # 更新資料庫：將 clip_path 設為 NULL
-                conn.execute(
-                    "UPDATE events SET clip_path = NULL WHERE event_id = ?",
-                    (record["event_id"],),
-                )
-
-        if not dry_run:
-            conn.commit()
-
-        conn.close()
+        deleted_event_ids: list[tuple[str]] = []
+
+        try:
+            for record in expired_clips:
+                clip_path = Path(record["clip_path"])
+
+                # 單次 stat 同時檢查檔案是否存在並記錄檔案大小
+                try:
+                    file_size = clip_path.stat().st_size
+                except FileNotFoundError:
+                    skipped_count += 1
+                    continue
+
+                if dry_run:
+                    # 乾運行模式：不實際刪除
+                    would_delete_count += 1
+                else:
+                    # 刪除檔案
+                    clip_path.unlink()
+                    deleted_count += 1
+                    freed_bytes += file_size
+                    deleted_event_ids.append((record["event_id"],))
+        finally:
+            # 更新資料庫：將 clip_path 設為 NULL（單一交易批次更新）
+            # 放在 finally 中，即使中途刪除失敗，已刪除的檔案也不會留下失效路徑
+            if deleted_event_ids:
+                with closing(sqlite3.connect(str(self.db_path))) as conn, conn:
+                    conn.executemany(
+                        "UPDATE events SET clip_path = NULL WHERE event_id = ?",
+                        deleted_event_ids,
+                    )
 
         duration_sec = time.time() - start_time
 
@@ -0,0 +1,102 @@
+import threading
+
+import pytest
+
+from src.core.config import load_config
+
+
+class FakeTimer:
+    """Synchronous stand-in for threading.Timer; the callback runs only when fired."""
+
+    def __init__(self, interval, function, args=None, kwargs=None):
+        self.interval = interval
+        self.function = function
+        self.args = args or []
+        self.kwargs = kwargs or {}
+        self.daemon = False
+        self.ident = None
+        self.started = False
+        self.cancelled = False
+        self.fired = False
+
+    def start(self):
+        self.started = True
+
+    def cancel(self):
+        self.cancelled = True
+
+    def fire(self):
+        if self.started and not self.cancelled and not self.fired:
+            self.fired = True
+            # A real Timer runs its callback on its own thread; mirror that thread's ident so
+            # callbacks matching on threading.current_thread().ident recognise this timer
+            self.ident = threading.get_ident()
+            self.function(*self.args, **self.kwargs)
+
+
+class FakeScheduler:
+    """timer_factory for ClipRecorder that records timers and runs them on demand."""
+
+    def __init__(self):
+        self.timers: list[FakeTimer] = []
+
+    def __call__(self, interval, function, args=None, kwargs=None):
+        timer = FakeTimer(interval, function, args, kwargs)
+        self.timers.append(timer)
+        return timer
+
+    def run_pending(self):
+        for timer in self.timers:
+            timer.fire()
+
+
+@pytest.fixture
+def fake_scheduler():
+    """FakeScheduler to pass as ClipRecorder(timer_factory=...); flush with run_pending()."""
+    return FakeScheduler()
+
+
+CONFIG_YAML = """
+camera:
+  source: 0
+  fps: 15
+  resolution: [640, 480]
+
+detection:
+  model: "yolov8n.pt"
+  pose_model: "yolo11s-pose.pt"
+  confidence: 0.5
+  classes: [0]
+
+analysis:
+  fall_threshold: 1.3
+  delay_sec: 3.0
+  same_event_window: 60.0
+  re_notify_interval: 120.0
+
+recording:
+  buffer_seconds: 10
+  clip_before_sec: 5
+  clip_after_sec: 5
+
+notification:
+  line_channel_access_token: "${LINE_BOT_CHANNEL_ACCESS_TOKEN}"
+  line_user_id: "${LINE_BOT_USER_ID}"
+  enabled: true
+
+lifecycle:
+  clip_retention_days: 7
+"""
+
+
+@pytest.fixture(scope="session")
+def config_file(tmp_path_factory):
+    config_path = tmp_path_factory.mktemp("config") / "settings.yaml"
+    config_path.write_text(CONFIG_YAML)
+    return config_path
+
+
+@pytest.fixture(scope="session")
+def loaded_config(config_file):
+    """Config parsed once per session; treat as read-only."""
+    return load_config(str(config_file))
@@ -92,28 +92,23 @@ class TestClipCleanup:
 
     def test_get_expired_clips_mixed_records(self, cleanup, test_db, clips_dir):
         """測試混合新舊記錄時只回傳過期的"""
-        conn = sqlite3.connect(str(test_db))
-
-        # 插入 3 天前的記錄（未過期）
         three_days_ago = time.time() - (3 * 24 * 60 * 60)
-        conn.execute(
-            """
-            INSERT INTO events (event_id, confirmed_at, clip_path, created_at)
-            VALUES (?, ?, ?, ?)
-            """,
+        ten_days_ago = time.time() - (10 * 24 * 60 * 60)
+        rows = [
+            # 3 天前的記錄（未過期）
             ("evt_new", three_days_ago, str(clips_dir / "evt_new.mp4"), three_days_ago),
-        )
+            # 10 天前的記錄（已過期）
+            ("evt_old", ten_days_ago, str(clips_dir / "evt_old.mp4"), ten_days_ago),
+        ]
 
-        # 插入 10 天前的記錄（已過期）
-        ten_days_ago = time.time() - (10 * 24 * 60 * 60)
-        conn.execute(
+        conn = sqlite3.connect(str(test_db))
+        conn.executemany(
             """
             INSERT INTO events (event_id, confirmed_at, clip_path, created_at)
             VALUES (?, ?, ?, ?)
             """,
-            ("evt_old", ten_days_ago, str(clips_dir / "evt_old.mp4"), ten_days_ago),
+            rows,
         )
-
         conn.commit()
         conn.close()
 
@@ -200,6 +195,50 @@ class TestClipCleanup:
         assert result is not None
         assert result[0] is None  # clip_path 應該被設為 NULL
 
+    def test_cleanup_updates_database_when_unlink_fails(
+        self, cleanup, test_db, clips_dir, monkeypatch
+    ):
+        """測試中途刪除失敗時，已刪除的檔案仍會更新資料庫"""
+        ten_days_ago = time.time() - (10 * 24 * 60 * 60)
+        deleted_path = clips_dir / "evt_first.mp4"
+        locked_path = clips_dir / "evt_locked.mp4"
+        deleted_path.write_text("fake video data")
+        locked_path.write_text("fake video data")
+
+        conn = sqlite3.connect(str(test_db))
+        conn.executemany(
+            """
+            INSERT INTO events (event_id, confirmed_at, clip_path, created_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            [
+                ("evt_first", ten_days_ago, str(deleted_path), ten_days_ago),
+                ("evt_locked", ten_days_ago + 1, str(locked_path), ten_days_ago + 1),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        real_unlink = Path.unlink
+
+        def failing_unlink(self, *args, **kwargs):
+            if self == locked_path:
+                raise PermissionError(f"locked: {self}")
+            return real_unlink(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "unlink", failing_unlink)
+
+        with pytest.raises(PermissionError):
+            cleanup.cleanup()
+
+        conn = sqlite3.connect(str(test_db))
+        rows = dict(conn.execute("SELECT event_id, clip_path FROM events").fetchall())
+        conn.close()
+
+        assert not deleted_path.exists()
+        assert rows["evt_first"] is None  # 已刪除的檔案不應留下失效路徑
+        assert rows["evt_locked"] == str(locked_path)
+
     def test_cleanup_dry_run(self, cleanup, test_db, clips_dir):
         """測試乾運行模式（不實際刪除）"""
         ten_days_ago = time.time() - (10 * 24 * 60 * 60)
@@ -229,20 +268,21 @@ class TestClipCleanup:
         """測試清理統計資訊完整性"""
         # 建立多個過期檔案
         ten_days_ago = time.time() - (10 * 24 * 60 * 60)
-        conn = sqlite3.connect(str(test_db))
+        rows = []
 
         for i in range(3):
             clip_path = clips_dir / f"evt_{i}.mp4"
             clip_path.write_bytes(b"x" * 1000)  # 1000 bytes
+            rows.append((f"evt_{i}", ten_days_ago, str(clip_path), ten_days_ago))
 
-            conn.execute(
-                """
-                INSERT INTO events (event_id, confirmed_at, clip_path, created_at)
-                VALUES (?, ?, ?, ?)
-                """,
-                (f"evt_{i}", ten_days_ago, str(clip_path), ten_days_ago),
-            )
-
+        conn = sqlite3.connect(str(test_db))
+        conn.executemany(
+            """
+            INSERT INTO events (event_id, confirmed_at, clip_path, created_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            rows,
+        )
         conn.commit()
         conn.close()
 
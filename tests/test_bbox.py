@@ -1,5 +1,8 @@
+import pytest
 from src.detection.bbox import BBox
 
+pytestmark = pytest.mark.parallel_safe
+
 
 class TestBBox:
     def test_create_bbox(self):
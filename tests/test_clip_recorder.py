@@ -1,10 +1,17 @@
+import time
 import pytest
 import numpy as np
 from unittest.mock import patch
-from src.events.clip_recorder import ClipRecorder
-from src.capture.rolling_buffer import FrameData
 
+pytest.importorskip("cv2")
 
+from src.events.clip_recorder import ClipRecorder  # noqa: E402
+from src.events.event_logger import EventLogger  # noqa: E402
+from src.events.observer import FallEvent  # noqa: E402
+from src.capture.rolling_buffer import FrameData, RollingBuffer  # noqa: E402
+
+
+@pytest.mark.parallel_safe
 class TestClipRecorder:
     @pytest.fixture
     def output_dir(self, tmp_path):
@@ -16,14 +23,12 @@ class TestClipRecorder:
     def recorder(self, output_dir):
         return ClipRecorder(output_dir=str(output_dir), fps=15)
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_frames(self):
-        frames = []
-        for i in range(30):
-            frame = np.zeros((480, 640, 3), dtype=np.uint8)
-            frame[:, :, 0] = i * 8
-            frames.append(FrameData(timestamp=float(i) / 15, frame=frame, bbox=None))
-        return frames
+        # VideoWriter is mocked in every consumer, so all frames can share one read-only buffer
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        frame.setflags(write=False)
+        return [FrameData(timestamp=float(i) / 15, frame=frame, bbox=None) for i in range(30)]
 
     def test_generate_filename(self, recorder):
         filename = recorder._generate_filename("evt_123")
@@ -54,22 +59,16 @@ class TestClipRecorder:
             assert mock_instance.write.call_count == len(sample_frames)
 
 
-def test_clip_recorder_on_fall_confirmed_saves_clip(tmp_path):
+def test_clip_recorder_on_fall_confirmed_saves_clip(tmp_path, fake_scheduler):
     """
     Verify that ClipRecorder saves a clip after the configured delay when a fall is confirmed and records the clip path in the event logger.
     
     This test:
     - Uses a RollingBuffer populated with sample frames and an EventLogger backed by a temporary database.
-    - Mocks the video writer to avoid actual encoding and asserts that no write is attempted immediately after confirmation, then that writing occurs after the configured clip_after_sec delay.
+    - Mocks the video writer to avoid actual encoding and asserts that no write is attempted immediately after confirmation, then that writing occurs once the scheduled clip_after_sec timer fires.
+    - Injects the fake_scheduler fixture as timer_factory so the delay is flushed synchronously instead of slept through.
     - Confirms the event record is updated with a non-None `clip_path`.
     """
-    import time
-    import numpy as np
-    from src.capture.rolling_buffer import RollingBuffer, FrameData
-    from src.events.clip_recorder import ClipRecorder
-    from src.events.event_logger import EventLogger
-    from src.events.observer import FallEvent
-
     # Setup
     buffer = RollingBuffer(buffer_seconds=10, fps=15)
     event_time = time.time()
@@ -82,7 +81,8 @@ def test_clip_recorder_on_fall_confirmed_saves_clip(tmp_path):
 
     db_path = str(tmp_path / "test.db")
     event_logger = EventLogger(db_path=db_path)
-    clip_after_sec = 0.1  # Short delay for testing
+    clip_after_sec = 0.1
+    scheduler = fake_scheduler
     recorder = ClipRecorder(
         rolling_buffer=buffer,
         event_logger=event_logger,
@@ -90,6 +90,7 @@ def test_clip_recorder_on_fall_confirmed_saves_clip(tmp_path):
         clip_after_sec=clip_after_sec,
         output_dir=str(tmp_path / "clips"),
         fps=15,
+        timer_factory=scheduler,
     )
 
     # Create event and trigger observer
@@ -110,9 +111,10 @@ def test_clip_recorder_on_fall_confirmed_saves_clip(tmp_path):
 
         # Recording is now delayed, verify NOT called immediately
         assert not mock_writer.called
+        assert scheduler.timers[0].interval == clip_after_sec
 
-        # Wait for delay + small buffer
-        time.sleep(clip_after_sec + 0.2)
+        # Fire the scheduled save
+        scheduler.run_pending()
 
         # Verify VideoWriter was called (clip save attempted)
         mock_writer.assert_called_once()
@@ -1,8 +1,11 @@
+import pytest
 from src.analysis.delay_confirm import DelayConfirm, FallState
 from src.events.observer import FallEvent
 
 
 class MockObserver:
+    __slots__ = ("confirmed_events", "recovered_events")
+
     def __init__(self):
         self.confirmed_events: list[FallEvent] = []
         self.recovered_events: list[FallEvent] = []
@@ -19,40 +22,31 @@ class MockObserver:
 
 
 class TestDelayConfirmStates:
-    def test_initial_state_is_normal(self):
-        dc = DelayConfirm(delay_sec=3.0)
-        assert dc.state == FallState.NORMAL
-
-    def test_normal_to_suspected_on_fall(self):
-        dc = DelayConfirm(delay_sec=3.0)
-        state = dc.update(is_fallen=True, current_time=0.0)
-        assert state == FallState.SUSPECTED
-
-    def test_suspected_to_normal_on_recovery(self):
-        dc = DelayConfirm(delay_sec=3.0)
-        dc.update(is_fallen=True, current_time=0.0)
-        state = dc.update(is_fallen=False, current_time=1.0)
-        assert state == FallState.NORMAL
-
-    def test_suspected_stays_before_delay(self):
+    @pytest.mark.parametrize(
+        "updates,expected",
+        [
+            ([], FallState.NORMAL),
+            ([(True, 0.0)], FallState.SUSPECTED),
+            ([(True, 0.0), (False, 1.0)], FallState.NORMAL),
+            ([(True, 0.0), (True, 2.9)], FallState.SUSPECTED),
+            ([(True, 0.0), (True, 2.0), (True, 3.1)], FallState.CONFIRMED),
+            ([(True, 0.0), (True, 4.0), (False, 5.0)], FallState.NORMAL),
+        ],
+        ids=[
+            "initial_state_is_normal",
+            "normal_to_suspected_on_fall",
+            "suspected_to_normal_on_recovery",
+            "suspected_stays_before_delay",
+            "suspected_to_confirmed_after_delay",
+            "confirmed_to_normal_on_recovery",
+        ],
+    )
+    def test_transitions(self, updates, expected):
         dc = DelayConfirm(delay_sec=3.0)
-        dc.update(is_fallen=True, current_time=0.0)
-        state = dc.update(is_fallen=True, current_time=2.9)
-        assert state == FallState.SUSPECTED
-
-    def test_suspected_to_confirmed_after_delay(self):
-        dc = DelayConfirm(delay_sec=3.0)
-        dc.update(is_fallen=True, current_time=0.0)
-        dc.update(is_fallen=True, current_time=2.0)
-        state = dc.update(is_fallen=True, current_time=3.1)
-        assert state == FallState.CONFIRMED
-
-    def test_confirmed_to_normal_on_recovery(self):
-        dc = DelayConfirm(delay_sec=3.0)
-        dc.update(is_fallen=True, current_time=0.0)
-        dc.update(is_fallen=True, current_time=4.0)
-        state = dc.update(is_fallen=False, current_time=5.0)
-        assert state == FallState.NORMAL
+        state = dc.state
+        for is_fallen, current_time in updates:
+            state = dc.update(is_fallen=is_fallen, current_time=current_time)
+        assert state == expected
 
 
 class TestDelayConfirmObservers:
@@ -1,5 +1,6 @@
 """Tests for delayed clip recording (post-event recording)."""
 
+import threading
 import time
 from unittest.mock import MagicMock, patch
 
@@ -10,16 +11,19 @@ from src.capture.rolling_buffer import FrameData, RollingBuffer
 from src.events.clip_recorder import ClipRecorder
 from src.events.observer import FallEvent
 
+# Pixel content is never inspected here; the buffer copies on push, so one array suffices
+_SHARED_FRAME = np.zeros((480, 640, 3), dtype=np.uint8)
+
 
 class TestDelayedRecording:
     """Tests for delayed clip recording after fall confirmed."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def rolling_buffer(self):
         """
         Create a RollingBuffer preloaded with approximately 4 seconds of test frames and return it along with the reference event timestamp.
         
-        The buffer is instantiated with 10 seconds of capacity at 15 FPS and seeded with 60 FrameData objects. Each frame is a zeroed 480x640 RGB numpy array; timestamps start at event_time - 2 seconds and advance by ~0.066 seconds (≈15 FPS), covering roughly event_time - 2 to event_time + 1.9.
+        The buffer is instantiated with 10 seconds of capacity at 15 FPS and seeded with 60 FrameData objects, all pushed from the zeroed 480x640 RGB _SHARED_FRAME; timestamps start at event_time - 2 seconds and advance by ~0.066 seconds (≈15 FPS), covering roughly event_time - 2 to event_time + 1.9. Built once per module: tests only schedule recordings against it and never push or clear.
         
         Returns:
             tuple: (RollingBuffer, float) — the preloaded rolling buffer and the generated event_time timestamp.
@@ -27,10 +31,9 @@ class TestDelayedRecording:
         buffer = RollingBuffer(buffer_seconds=10, fps=15)
         event_time = time.time()
         for i in range(60):  # 4 seconds of frames
-            frame = np.zeros((480, 640, 3), dtype=np.uint8)
             frame_data = FrameData(
                 timestamp=event_time - 2 + i * 0.066,  # ~15fps
-                frame=frame,
+                frame=_SHARED_FRAME,
                 bbox=None,
             )
             buffer.push(frame_data)
@@ -55,7 +58,9 @@ class TestDelayedRecording:
             notification_count=1,
         )
 
-    def test_recording_is_delayed_by_clip_after_sec(self, rolling_buffer, fall_event, tmp_path):
+    def test_recording_is_delayed_by_clip_after_sec(
+        self, rolling_buffer, fall_event, tmp_path, fake_scheduler
+    ):
         """Recording should happen after clip_after_sec delay, not immediately."""
         buffer, _ = rolling_buffer
         clip_after_sec = 0.2
@@ -66,6 +71,7 @@ class TestDelayedRecording:
             clip_after_sec=clip_after_sec,
             output_dir=str(tmp_path / "clips"),
             fps=15,
+            timer_factory=fake_scheduler,
         )
 
         with patch.object(recorder, "save", return_value="/fake/path.mp4") as mock_save:
@@ -73,37 +79,41 @@ class TestDelayedRecording:
 
             # Should NOT be called immediately
             assert not mock_save.called
+            assert fake_scheduler.timers[0].interval == clip_after_sec
 
-            # Wait for delay + buffer
-            time.sleep(clip_after_sec + 0.1)
+            # Fast-forward past the delay
+            fake_scheduler.run_pending()
 
-            # Now should be called
+            # Now should be called, and the fired timer dropped from the pending list
             mock_save.assert_called_once()
+            assert recorder._pending_recordings == []
 
         recorder.shutdown()
 
-    def test_recording_not_called_if_shutdown_before_delay(self, rolling_buffer, fall_event, tmp_path):
+    def test_recording_not_called_if_shutdown_before_delay(
+        self, rolling_buffer, fall_event, tmp_path, fake_scheduler
+    ):
         """Shutdown should cancel pending recordings before they execute."""
         buffer, _ = rolling_buffer
-        clip_after_sec = 0.5  # Longer delay
 
         recorder = ClipRecorder(
             rolling_buffer=buffer,
             clip_before_sec=1.0,
-            clip_after_sec=clip_after_sec,
+            clip_after_sec=0.5,
             output_dir=str(tmp_path / "clips"),
             fps=15,
+            timer_factory=fake_scheduler,
         )
 
         with patch.object(recorder, "save", return_value="/fake/path.mp4") as mock_save:
             recorder.on_fall_confirmed(fall_event)
 
             # Shutdown before delay completes
-            time.sleep(0.1)
             recorder.shutdown()
+            assert fake_scheduler.timers[0].cancelled
 
-            # Wait past original delay time
-            time.sleep(clip_after_sec)
+            # Fast-forward past the original delay
+            fake_scheduler.run_pending()
 
             # Save should NOT have been called (timer was cancelled)
             assert not mock_save.called
@@ -166,12 +176,14 @@ class TestDelayedRecording:
 
         event = FallEvent("evt_cleanup", event_time, event_time, 1)
 
-        with patch.object(recorder, "save", return_value="/fake/path.mp4"):
+        done = threading.Event()
+        with patch.object(recorder, "save") as mock_save:
+            mock_save.side_effect = lambda *a, **k: (done.set(), "/fake/path.mp4")[1]
             recorder.on_fall_confirmed(event)
             assert len(recorder._pending_recordings) == 1
 
-            # Wait for timer to complete
-            time.sleep(clip_after_sec + 0.2)
+            # The timer drops itself from the pending list before calling save
+            assert done.wait(timeout=1.0)
 
             # Timer should be removed after completion
             assert len(recorder._pending_recordings) == 0
@@ -179,13 +191,12 @@ class TestDelayedRecording:
         recorder.shutdown()
 
 
+@pytest.mark.slow
 class TestRollingBufferThreadSafety:
     """Tests for RollingBuffer thread safety."""
 
     def test_concurrent_push_and_get_clip(self):
         """Buffer should handle concurrent push and get_clip safely."""
-        import threading
-
         buffer = RollingBuffer(buffer_seconds=5, fps=30)
         errors = []
         event_time = time.time()
@@ -194,11 +205,11 @@ class TestRollingBufferThreadSafety:
             """
             Pushes 100 synthetic frames into the shared RollingBuffer to simulate a producer load for concurrency tests.
             
-            Each pushed FrameData uses a zeroed 100x100 RGB frame and a timestamp starting at `event_time` incremented by ~0.033s per frame; a short sleep is performed between pushes to stagger production. Any exception raised during the loop is appended to the `errors` list.
+            Every FrameData reuses one zeroed 100x100 RGB frame (the buffer copies on push) with a timestamp starting at `event_time` incremented by ~0.033s per frame; a short sleep is performed between pushes to stagger production. Any exception raised during the loop is appended to the `errors` list.
             """
+            frame = np.zeros((100, 100, 3), dtype=np.uint8)
             try:
                 for i in range(100):
-                    frame = np.zeros((100, 100, 3), dtype=np.uint8)
                     buffer.push(FrameData(event_time + i * 0.033, frame, None))
                     time.sleep(0.001)
             except Exception as e:
@@ -232,8 +243,6 @@ class TestRollingBufferThreadSafety:
 
     def test_concurrent_push_and_len(self):
         """Buffer should handle concurrent push and __len__ safely."""
-        import threading
-
         buffer = RollingBuffer(buffer_seconds=2, fps=30)
         errors = []
 
@@ -241,11 +250,11 @@ class TestRollingBufferThreadSafety:
             """
             Pushes 100 empty frames with increasing timestamps into the shared rolling buffer and records any exception.
             
-            Each pushed frame is a 100x100 RGB array of zeros with a timestamp of 0.0 through 99.0. If an exception occurs during pushing, it is appended to the `errors` list.
+            All pushes share one 100x100 RGB array of zeros, each with a timestamp of 0.0 through 99.0. If an exception occurs during pushing, it is appended to the `errors` list.
             """
+            frame = np.zeros((100, 100, 3), dtype=np.uint8)
             try:
                 for i in range(100):
-                    frame = np.zeros((100, 100, 3), dtype=np.uint8)
                     buffer.push(FrameData(float(i), frame, None))
             except Exception as e:
                 errors.append(e)
@@ -26,6 +26,14 @@ class TestEventLogger:
         assert cursor.fetchone() is not None
         conn.close()
 
+    def test_creates_created_at_index(self, logger, db_path):
+        conn = sqlite3.connect(str(db_path))
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_events_created_at'"
+        )
+        assert cursor.fetchone() is not None
+        conn.close()
+
     def test_log_event(self, logger, db_path):
         event = FallEvent(
             event_id="evt_123",
@@ -1,3 +1,4 @@
+import threading
 import numpy as np
 from src.capture.rolling_buffer import RollingBuffer, FrameData
 
@@ -41,3 +42,101 @@ class TestRollingBuffer:
             buffer.push(FrameData(timestamp=float(i), frame=frame, bbox=None))
         buffer.clear()
         assert len(buffer) == 0
+
+    def test_push_copies_frame(self):
+        buffer = RollingBuffer(buffer_seconds=1.0, fps=10.0)
+        frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        buffer.push(FrameData(timestamp=0.0, frame=frame, bbox=None))
+        frame[:] = 255
+
+        clip = buffer.get_clip(event_time=0.0, before_sec=1.0, after_sec=1.0)
+        assert clip[0].frame.max() == 0
+
+    def test_get_clip_survives_overwrite(self):
+        buffer = RollingBuffer(buffer_seconds=1.0, fps=2.0)
+        for i in range(2):
+            frame = np.full((48, 64, 3), i, dtype=np.uint8)
+            buffer.push(FrameData(timestamp=float(i), frame=frame, bbox=None))
+        clip = buffer.get_clip(event_time=0.0, before_sec=0.0, after_sec=0.0)
+
+        for i in range(2, 4):
+            frame = np.full((48, 64, 3), i, dtype=np.uint8)
+            buffer.push(FrameData(timestamp=float(i), frame=frame, bbox=None))
+
+        assert clip[0].frame.max() == 0
+
+    def test_get_clip_ordered_after_wraparound(self):
+        buffer = RollingBuffer(buffer_seconds=1.0, fps=4.0)
+        for i in range(7):
+            frame = np.full((48, 64, 3), i, dtype=np.uint8)
+            buffer.push(FrameData(timestamp=float(i), frame=frame, bbox=(i, i, 1, 1)))
+
+        clip = buffer.get_clip(event_time=5.0, before_sec=5.0, after_sec=5.0)
+
+        assert [f.timestamp for f in clip] == [3.0, 4.0, 5.0, 6.0]
+        assert [int(f.frame[0, 0, 0]) for f in clip] == [3, 4, 5, 6]
+        assert [f.bbox for f in clip] == [(i, i, 1, 1) for i in range(3, 7)]
+
+    def test_get_clip_drops_frames_overwritten_between_chunks(self, monkeypatch):
+        monkeypatch.setattr(RollingBuffer, "_COPY_CHUNK_FRAMES", 1)
+        buffer = RollingBuffer(buffer_seconds=1.0, fps=4.0)
+        for i in range(4):
+            frame = np.full((48, 64, 3), i, dtype=np.uint8)
+            buffer.push(FrameData(timestamp=float(i), frame=frame, bbox=None))
+
+        class InterleavingLock:
+            """Pushes two frames right after get_clip copies its first chunk."""
+
+            def __init__(self):
+                self._lock = threading.Lock()
+                self.releases = 0
+
+            def __enter__(self):
+                self._lock.acquire()
+
+            def __exit__(self, *exc):
+                self._lock.release()
+                self.releases += 1
+                if self.releases == 2:  # metadata snapshot, then chunk 0
+                    for i in (4, 5):
+                        frame = np.full((48, 64, 3), i, dtype=np.uint8)
+                        buffer.push(FrameData(timestamp=float(i), frame=frame, bbox=None))
+
+        buffer._lock = InterleavingLock()
+        clip = buffer.get_clip(event_time=1.5, before_sec=1.5, after_sec=1.5)
+
+        # Frame 0 was copied before being overwritten; frame 1 was overwritten first
+        assert [f.timestamp for f in clip] == [0.0, 2.0, 3.0]
+        assert [int(f.frame[0, 0, 0]) for f in clip] == [0, 2, 3]
+
+    def test_get_clip_after_clear_during_copy_returns_copied_frames(self, monkeypatch):
+        monkeypatch.setattr(RollingBuffer, "_COPY_CHUNK_FRAMES", 1)
+        buffer = RollingBuffer(buffer_seconds=1.0, fps=4.0)
+        for i in range(3):
+            frame = np.full((48, 64, 3), i, dtype=np.uint8)
+            buffer.push(FrameData(timestamp=float(i), frame=frame, bbox=None))
+
+        class ClearingLock:
+            """Clears and refills the buffer right after get_clip copies its first chunk."""
+
+            def __init__(self):
+                self._lock = threading.Lock()
+                self.releases = 0
+
+            def __enter__(self):
+                self._lock.acquire()
+
+            def __exit__(self, *exc):
+                self._lock.release()
+                self.releases += 1
+                if self.releases == 2:  # metadata snapshot, then chunk 0
+                    buffer.clear()
+                    frame = np.full((48, 64, 3), 9, dtype=np.uint8)
+                    buffer.push(FrameData(timestamp=1.0, frame=frame, bbox=None))
+
+        buffer._lock = ClearingLock()
+        clip = buffer.get_clip(event_time=1.0, before_sec=1.0, after_sec=1.0)
+
+        # Slots refilled after clear() must not leak into the clip
+        assert [f.timestamp for f in clip] == [0.0]
+        assert int(clip[0].frame[0, 0, 0]) == 0